@@ -21,7 +21,7 @@
 # knowledge_base_path = "books/book.pdf"
 # files = glob.glob(knowledge_base_path) # glob finds files whose names match a specified pattern.
 # print(f"found {len(files)} files in the knowledge base")
-# entire_knowledge_base = ""
+# parts = []
 
 # from pypdf import PdfReader
 # # for file_path in files:
@@ -32,8 +32,9 @@
 #     for page in reader.pages:
 #         text = page.extract_text()
 #         if text:
-#             entire_knowledge_base += text
-#             entire_knowledge_base += "\n\n"
+#             parts.append(text)
+#             parts.append("\n\n")
+# entire_knowledge_base = "".join(parts)
 
 # print(f"Total characters in knowledge base: {len(entire_knowledge_base):,}")
 